@@ -0,0 +1,130 @@
+const { spawn } = require('child_process');
+const path = require('path');
+const readline = require('readline');
+
+// Long-lived Python scoring worker (ml_model/predict.py --serve).
+// Requests are newline-delimited JSON answered in order, so the model and
+// its drift monitor stay loaded across assessments.
+const mlModelPath = path.join(__dirname, '../../ml_model');
+const pythonScript = path.join(mlModelPath, 'predict.py');
+const pythonCommand = process.platform === 'win32' ? 'python' : 'python3';
+const REQUEST_TIMEOUT = 15000;
+const PSI_ALERT = 0.25;
+
+function driftedFeatures(drift) {
+  return Object.entries(drift.features)
+    .filter(([, scores]) => scores.psi > PSI_ALERT || scores.unseen > 0)
+    .map(([name, scores]) => `${name} (PSI ${scores.psi}, unseen ${scores.unseen})`);
+}
+
+function createMlWorker({
+  command = pythonCommand,
+  args = [pythonScript, '--serve'],
+  cwd = mlModelPath,
+  timeout = REQUEST_TIMEOUT
+} = {}) {
+  let worker = null;
+  let driftStatus = null;
+  let lastReportRecords = null;
+
+  // Fail everything still waiting on this worker. Each worker has its own
+  // queue, so a late reply from a replaced worker can never be handed to
+  // a request sent to its successor.
+  function stopWorker(current, error) {
+    if (current.stopped) return;
+    current.stopped = true;
+    if (worker === current) worker = null;
+    current.child.kill();
+
+    const waiting = current.pending;
+    current.pending = [];
+    waiting.forEach(request => {
+      clearTimeout(request.timer);
+      request.reject(error);
+    });
+  }
+
+  function recordDrift(drift) {
+    if (!drift || drift.total_records === lastReportRecords) return;
+    lastReportRecords = drift.total_records;
+
+    // The full report only goes to the server log; it contains live
+    // prediction counts that must not be served publicly
+    const drifted = driftedFeatures(drift);
+    driftStatus = {
+      lastReportAt: new Date().toISOString(),
+      drifted: drifted.length > 0
+    };
+
+    console.log(`📈 ML drift report: ${drift.window_records} records, prediction PSI ${drift.prediction_psi}`);
+    if (drifted.length > 0) {
+      console.log(`⚠️ Drifted features: ${drifted.join(', ')}`);
+    }
+  }
+
+  function startWorker() {
+    const child = spawn(command, args, { cwd });
+    const current = { child, pending: [], stopped: false };
+    lastReportRecords = null;
+
+    readline.createInterface({ input: child.stdout }).on('line', line => {
+      if (current.stopped) return;
+      const request = current.pending.shift();
+      if (!request) return;
+      clearTimeout(request.timer);
+
+      try {
+        const result = JSON.parse(line);
+        recordDrift(result.drift);
+        request.resolve(result);
+      } catch (error) {
+        request.reject(error);
+      }
+    });
+
+    child.stderr.on('data', data => {
+      console.error('ML worker:', data.toString().trim());
+    });
+    child.stdin.on('error', error => stopWorker(current, error));
+    child.on('error', error => stopWorker(current, error));
+    child.on('close', code => stopWorker(current, new Error(`ML worker exited with code ${code}`)));
+
+    return current;
+  }
+
+  // Score one assessment (or a list of them) with the worker
+  function predict(data) {
+    return new Promise((resolve, reject) => {
+      if (!worker) {
+        worker = startWorker();
+      }
+      const current = worker;
+
+      const request = { resolve, reject };
+      request.timer = setTimeout(() => {
+        // A late reply would desynchronise the queue, so restart the worker
+        stopWorker(current, new Error('ML worker timed out'));
+      }, timeout);
+      current.pending.push(request);
+
+      current.child.stdin.write(JSON.stringify(data) + '\n');
+    });
+  }
+
+  // Time of the most recent drift report and whether any feature drifted
+  function getDriftStatus() {
+    return driftStatus;
+  }
+
+  function stop() {
+    if (worker) stopWorker(worker, new Error('ML worker stopped'));
+  }
+
+  return { predict, getDriftStatus, stop };
+}
+
+const defaultWorker = createMlWorker();
+
+exports.createMlWorker = createMlWorker;
+exports.predict = defaultWorker.predict;
+exports.getDriftStatus = defaultWorker.getDriftStatus;
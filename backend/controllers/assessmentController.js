@@ -1,7 +1,5 @@
 const db = require('../config/db');
-const { execSync } = require('child_process');
-const path = require('path');
-const fs = require('fs');
+const mlWorker = require('../config/mlWorker');
 
 // Mock prediction fallback function
 function mockPrediction(assessmentData) {
@@ -172,32 +170,8 @@ exports.submitAssessment = async (req, res) => {
     // Call Python ML model with improved error handling
     let prediction;
     try {
-      const mlModelPath = path.join(__dirname, '../../ml_model');
-      const pythonScript = path.join(mlModelPath, 'predict.py');
-      
-      // Write data to temporary JSON file
-      const tempFile = path.join(mlModelPath, `temp_input_${userId}_${Date.now()}.json`);
-      fs.writeFileSync(tempFile, JSON.stringify(mlData));
-      
-      // Execute Python script
-      const pythonCommand = process.platform === 'win32' ? 'python' : 'python3';
-      const command = `${pythonCommand} "${pythonScript}" "${tempFile}"`;
-      
-      const result = execSync(command, { 
-        cwd: mlModelPath, 
-        encoding: 'utf-8',
-        timeout: 15000,
-        maxBuffer: 10 * 1024 * 1024
-      });
-      
-      // Clean up temp file
-      try {
-        fs.unlinkSync(tempFile);
-      } catch (cleanupError) {
-        console.log('Temp file cleanup warning:', cleanupError.message);
-      }
-      
-      prediction = JSON.parse(result);
+      // Score with the long-lived Python worker
+      prediction = await mlWorker.predict(mlData);
       
       if (!prediction.success) {
         throw new Error(prediction.error || 'Python prediction failed');
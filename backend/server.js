@@ -6,6 +6,7 @@ require('dotenv').config();
 
 // Import database connection
 const db = require('./config/db');
+const mlWorker = require('./config/mlWorker');
 
 // Import routes
 const authRoutes = require('./routes/authRoutes');
@@ -37,6 +38,7 @@ app.get('/api/health', (req, res) => {
     database: 'connected',
     mlModel: 'ready',
     accuracy: '90.40%',
+    mlDrift: mlWorker.getDriftStatus(),
     message: 'Server is running successfully'
   });
 });
@@ -0,0 +1,61 @@
+const test = require('node:test');
+const assert = require('node:assert');
+const { createMlWorker } = require('../config/mlWorker');
+
+// Fake scoring worker: answers each line after `delay` ms. Requests marked
+// `hold` are only answered when the worker is told to stop, like a busy
+// Python process flushing a late reply into the pipe as it is killed.
+const fakeWorker = `
+  const readline = require('readline');
+  const held = [];
+  const reply = request => {
+    process.stdout.write(JSON.stringify({ success: true, answer_for: request.user }) + '\\n');
+  };
+  process.on('SIGTERM', () => {
+    held.forEach(reply);
+    process.exit(0);
+  });
+  readline.createInterface({ input: process.stdin }).on('line', line => {
+    const request = JSON.parse(line);
+    if (request.hold) {
+      held.push(request);
+    } else {
+      setTimeout(() => reply(request), request.delay || 0);
+    }
+  });
+`;
+
+function createFakeWorker() {
+  return createMlWorker({
+    command: process.execPath,
+    args: ['-e', fakeWorker],
+    cwd: __dirname,
+    timeout: 300
+  });
+}
+
+test('answers requests in order', async () => {
+  const worker = createFakeWorker();
+  try {
+    const results = await Promise.all(['alice', 'bob', 'carol'].map(user => worker.predict({ user })));
+    assert.deepStrictEqual(results.map(result => result.answer_for), ['alice', 'bob', 'carol']);
+  } finally {
+    worker.stop();
+  }
+});
+
+test('a late reply after a timeout never reaches the next request', async () => {
+  const worker = createFakeWorker();
+  try {
+    await assert.rejects(worker.predict({ user: 'alice', hold: true }), /timed out/);
+
+    // bob goes to a fresh worker while alice's late reply is being flushed
+    const bob = await worker.predict({ user: 'bob', delay: 150 });
+    assert.strictEqual(bob.answer_for, 'bob');
+
+    const carol = await worker.predict({ user: 'carol' });
+    assert.strictEqual(carol.answer_for, 'carol');
+  } finally {
+    worker.stop();
+  }
+});
@@ -0,0 +1,226 @@
+import bisect
+import math
+import numpy as np
+import pandas as pd
+
+DRIFT_REFERENCE_PATH = 'models/drift_reference.json'
+
+# Numeric features with at most this many distinct training values get one
+# bin per value; wider ones (Screen_Time, Weekly_Work_Study_Hours, ...) get
+# quantile bins.
+MAX_DISCRETE_VALUES = 20
+QUANTILE_BINS = 10
+DRIFT_REPORT_EVERY = 500
+PSI_EPSILON = 1e-4
+
+
+def encoder_categories(encoder):
+    """Classes a LabelEncoder accepts, with a NaN class reported as None"""
+    return [None if isinstance(c, float) and c != c else str(c)
+            for c in encoder.classes_]
+
+
+def feature_bins(spec, known=None):
+    """
+    Binning rules for one reference feature: (lookup, missing, edges, n_bins).
+    Every histogram ends with an unseen bin. Categories outside `known`
+    (the classes the encoder accepts) are routed to it, as are missing values
+    unless the categories include a None (NaN) class.
+    """
+    if spec['type'] == 'categorical':
+        categories = spec['categories']
+        n_bins = len(categories) + 1
+        lookup = {c: i for i, c in enumerate(categories)
+                  if c is not None and (known is None or c in known)}
+        missing = n_bins - 1
+        if None in categories and (known is None or None in known):
+            missing = categories.index(None)
+        return lookup, missing, None, n_bins
+    n_bins = len(spec['edges']) + 2
+    return None, n_bins - 1, spec['edges'], n_bins
+
+
+def bin_counts(values, n_bins, lookup, missing, edges):
+    """Histogram of a Series, binned exactly as DriftMonitor.update would"""
+    na = values.isna().to_numpy()
+    if lookup is not None:
+        idx = values.astype(str).map(lookup).fillna(n_bins - 1)
+        idx = idx.to_numpy(dtype=np.int64, copy=True)
+    else:
+        numeric = pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+        idx = np.searchsorted(edges, numeric, side='right')
+        idx[np.isnan(numeric)] = n_bins - 1
+    idx[na] = missing
+    return np.bincount(idx, minlength=n_bins)
+
+
+def build_drift_reference(X_raw, predictions, encoders):
+    """
+    Build the training-time reference profile used by DriftMonitor.
+    X_raw holds the unencoded feature columns, predictions the model's
+    predicted classes for the same rows. Categorical bins are the classes
+    of the fitted label encoders, so anything predict.py would remap
+    lands in the unseen bin.
+    """
+    features = {}
+    for col in X_raw.columns:
+        values = X_raw[col]
+        if col in encoders:
+            spec = {'type': 'categorical',
+                    'categories': encoder_categories(encoders[col])}
+        elif not pd.api.types.is_numeric_dtype(values):
+            spec = {'type': 'categorical',
+                    'categories': sorted(values.dropna().astype(str).unique().tolist())}
+        else:
+            present = values.dropna().astype(float).to_numpy()
+            unique = np.unique(present)
+            if len(unique) <= MAX_DISCRETE_VALUES:
+                edges = ((unique[:-1] + unique[1:]) / 2).tolist()
+            else:
+                quantiles = np.quantile(present, np.linspace(0, 1, QUANTILE_BINS + 1))
+                edges = np.unique(quantiles[1:-1]).tolist()
+            spec = {'type': 'numeric', 'edges': edges}
+        lookup, missing, edges, n_bins = feature_bins(spec)
+        spec['counts'] = bin_counts(values, n_bins, lookup, missing, edges).tolist()
+        features[col] = spec
+
+    predictions = pd.Series(predictions).astype(str)
+    classes = sorted(predictions.unique().tolist())
+    class_counts = predictions.value_counts()
+    return {
+        'features': features,
+        'classes': classes,
+        'class_counts': [int(class_counts[c]) for c in classes] + [0]
+    }
+
+
+def population_stability_index(expected, actual):
+    """PSI between two histograms over the same bins"""
+    expected_total = float(sum(expected)) or 1.0
+    actual_total = float(sum(actual)) or 1.0
+    psi = 0.0
+    for e, a in zip(expected, actual):
+        e = max(e / expected_total, PSI_EPSILON)
+        a = max(a / actual_total, PSI_EPSILON)
+        psi += (a - e) * math.log(a / e)
+    return psi
+
+
+def ks_statistic(expected, actual):
+    """Largest gap between the binned CDFs of two histograms"""
+    expected_total = float(sum(expected)) or 1.0
+    actual_total = float(sum(actual)) or 1.0
+    e_cdf = a_cdf = gap = 0.0
+    for e, a in zip(expected, actual):
+        e_cdf += e / expected_total
+        a_cdf += a / actual_total
+        gap = max(gap, abs(a_cdf - e_cdf))
+    return gap
+
+
+class DriftMonitor:
+    """
+    Streaming input-drift monitor. Keeps fixed-size per-feature histograms
+    and predicted-class counts in memory, binned like the training reference
+    profile. Every report_every records the current window is scored
+    against the reference, folded into the running totals and reset, so
+    last_report always describes recent traffic. Nothing is written to disk.
+    """
+
+    def __init__(self, reference, encoders=None, report_every=DRIFT_REPORT_EVERY):
+        self.reference = reference
+        self.report_every = report_every
+        self.classes = reference['classes']
+        self.class_index = {c: i for i, c in enumerate(self.classes)}
+        self.class_counts = [0] * (len(self.classes) + 1)
+        self.class_totals = [0] * (len(self.classes) + 1)
+        self.features = []
+        for name, spec in reference['features'].items():
+            known = None
+            if encoders is not None and name in encoders:
+                known = set(encoder_categories(encoders[name]))
+            lookup, missing, edges, n_bins = feature_bins(spec, known)
+            self.features.append((name, lookup, missing, edges,
+                                  [0] * n_bins, [0] * n_bins))
+        self.window_records = 0
+        self.records = 0
+        self.last_report = None
+
+    def update(self, record, prediction):
+        """Record one input row (dict) and its predicted class"""
+        for name, lookup, missing, edges, counts, _ in self.features:
+            value = record.get(name)
+            if value is None or value != value:
+                counts[missing] += 1
+            elif lookup is not None:
+                counts[lookup.get(str(value), -1)] += 1
+            else:
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    counts[-1] += 1
+                    continue
+                counts[-1 if value != value else bisect.bisect_right(edges, value)] += 1
+        self.class_counts[self.class_index.get(str(prediction), -1)] += 1
+        self.window_records += 1
+        self.records += 1
+        if self.window_records >= self.report_every:
+            self.compute()
+
+    def update_batch(self, df, predictions):
+        """Record a DataFrame of raw input rows and their predicted classes"""
+        predictions = list(predictions)
+        start = 0
+        while start < len(df):
+            # Split at window boundaries so reports match row-by-row updates
+            stop = min(len(df), start + self.report_every - self.window_records)
+            chunk = df.iloc[start:stop]
+            for name, lookup, missing, edges, counts, _ in self.features:
+                if name not in chunk.columns:
+                    counts[missing] += len(chunk)
+                    continue
+                binned = bin_counts(chunk[name], len(counts), lookup, missing, edges)
+                for i, n in enumerate(binned):
+                    counts[i] += int(n)
+            for prediction in predictions[start:stop]:
+                self.class_counts[self.class_index.get(str(prediction), -1)] += 1
+            self.window_records += stop - start
+            self.records += stop - start
+            if self.window_records >= self.report_every:
+                self.compute()
+            start = stop
+
+    def compute(self):
+        """Score the current window against the reference, then reset it"""
+        features = {}
+        for name, lookup, missing, edges, counts, totals in self.features:
+            expected = self.reference['features'][name]['counts']
+            scores = {
+                'psi': round(population_stability_index(expected, counts), 4),
+                'unseen': counts[-1]
+            }
+            if edges is not None:
+                scores['ks'] = round(ks_statistic(expected, counts), 4)
+            for i, n in enumerate(counts):
+                totals[i] += n
+                counts[i] = 0
+            scores['total_unseen'] = totals[-1]
+            features[name] = scores
+
+        labels = self.classes + ['Unknown']
+        report = {
+            'window_records': self.window_records,
+            'total_records': self.records,
+            'features': features,
+            'prediction_psi': round(population_stability_index(
+                self.reference['class_counts'], self.class_counts), 4),
+            'prediction_counts': dict(zip(labels, self.class_counts))
+        }
+        for i, n in enumerate(self.class_counts):
+            self.class_totals[i] += n
+            self.class_counts[i] = 0
+        report['total_prediction_counts'] = dict(zip(labels, self.class_totals))
+
+        self.window_records = 0
+        self.last_report = report
+        return report
@@ -1,4 +1,5 @@
 import sys
+import os
 import json
 import joblib
 import pandas as pd
@@ -6,43 +7,74 @@ import numpy as np
 import warnings
 warnings.filterwarnings('ignore')
 
+from drift import DriftMonitor, DRIFT_REFERENCE_PATH, DRIFT_REPORT_EVERY
+
+MODEL_PATH = 'models/mental_health_model.pkl'
+ENCODERS_PATH = 'models/label_encoders.pkl'
+
+CATEGORICAL_COLS = ['Gender', 'Education_Level', 'Diet_Quality',
+                    'Physical_Disability', 'Chronic_Illness',
+                    'Work_Study_Pressure', 'Access_Therapy', 'Substance_Use']
+
+_artifacts = {}
+
+
+def load_artifacts():
+    """Load model, encoders and drift monitor once per process"""
+    if not _artifacts:
+        _artifacts['model'] = joblib.load(MODEL_PATH)
+        _artifacts['encoders'] = joblib.load(ENCODERS_PATH)
+        monitor = None
+        if os.path.exists(DRIFT_REFERENCE_PATH):
+            with open(DRIFT_REFERENCE_PATH, 'r', encoding='utf-8') as f:
+                monitor = DriftMonitor(
+                    json.load(f), encoders=_artifacts['encoders'],
+                    report_every=int(os.environ.get('DRIFT_REPORT_EVERY', DRIFT_REPORT_EVERY))
+                )
+        _artifacts['monitor'] = monitor
+    return _artifacts['model'], _artifacts['encoders'], _artifacts['monitor']
+
+
+def get_drift_metrics():
+    """Latest periodic drift report, or None if none has been computed yet"""
+    monitor = _artifacts.get('monitor')
+    return monitor.last_report if monitor is not None else None
+
+
+def encode_inputs(df, encoders):
+    """Encode categorical columns, mapping unseen values to the first class"""
+    for col in CATEGORICAL_COLS:
+        if col in df.columns and col in encoders:
+            le = encoders[col]
+            known = set(le.classes_)
+            values = df[col].where(df[col].isin(known), le.classes_[0])
+            df[col] = le.transform(values)
+    return df
+
+
+def risk_level_for(prediction):
+    return 'Critical' if prediction == 'Critical' else \
+           'High' if prediction == 'Poor' else \
+           'Moderate' if prediction == 'Fair' else 'Low'
+
 def predict_mental_health(input_data):
     """
     Predict mental health status from user assessment
     """
     try:
-        # Load model and encoders
-        model = joblib.load('models/mental_health_model.pkl')
-        encoders = joblib.load('models/label_encoders.pkl')
+        model, encoders, monitor = load_artifacts()
         
         # Create DataFrame from input
-        df = pd.DataFrame([input_data])
-        
-        # Encode categorical variables with error handling
-        categorical_cols = ['Gender', 'Education_Level', 'Diet_Quality', 
-                           'Physical_Disability', 'Chronic_Illness', 
-                           'Work_Study_Pressure', 'Access_Therapy', 'Substance_Use']
-        
-        for col in categorical_cols:
-            if col in df.columns and col in encoders:
-                le = encoders[col]
-                try:
-                    # Try to transform
-                    df[col] = le.transform(df[col])
-                except ValueError as e:
-                    # If value not seen during training, use most common value
-                    known_classes = list(le.classes_)
-                    if len(known_classes) > 0:
-                        # Use the first known class as default
-                        df[col] = le.transform([known_classes[0]])
-                    else:
-                        df[col] = 0
+        df = encode_inputs(pd.DataFrame([input_data]), encoders)
         
         # Make prediction
         prediction = model.predict(df)[0]
         probabilities = model.predict_proba(df)[0]
         confidence = max(probabilities) * 100
         
+        if monitor is not None:
+            monitor.update(input_data, prediction)
+        
         # Identify risk factors
         risk_factors = identify_risk_factors(input_data)
         
@@ -50,9 +82,7 @@ def predict_mental_health(input_data):
         recommendations = generate_recommendations(input_data, prediction)
         
         # Determine risk level
-        risk_level = 'Critical' if prediction == 'Critical' else \
-                    'High' if prediction == 'Poor' else \
-                    'Moderate' if prediction == 'Fair' else 'Low'
+        risk_level = risk_level_for(prediction)
         
         return {
             'success': True,
@@ -60,7 +90,46 @@ def predict_mental_health(input_data):
             'confidence': round(confidence, 2),
             'risk_level': risk_level,
             'risk_factors': risk_factors,
-            'recommendations': recommendations
+            'recommendations': recommendations,
+            'drift': get_drift_metrics()
+        }
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+def predict_mental_health_batch(records):
+    """
+    Predict mental health status for a list of assessments in one pass
+    """
+    try:
+        model, encoders, monitor = load_artifacts()
+        
+        raw = pd.DataFrame(records)
+        df = encode_inputs(raw.copy(), encoders)
+        
+        predictions = model.predict(df)
+        confidences = model.predict_proba(df).max(axis=1) * 100
+        
+        if monitor is not None:
+            monitor.update_batch(raw, predictions)
+        
+        results = []
+        for data, prediction, confidence in zip(records, predictions, confidences):
+            results.append({
+                'prediction': prediction,
+                'confidence': round(float(confidence), 2),
+                'risk_level': risk_level_for(prediction),
+                'risk_factors': identify_risk_factors(data),
+                'recommendations': generate_recommendations(data, prediction)
+            })
+        
+        return {
+            'success': True,
+            'results': results,
+            'drift': get_drift_metrics()
         }
         
     except Exception as e:
@@ -164,6 +233,32 @@ def generate_recommendations(data, prediction):
     
     return recommendations[:8]  # Return top 8 recommendations
 
+def predict_request(input_data):
+    """Score one request; a JSON list is scored as a batch"""
+    if isinstance(input_data, list):
+        return predict_mental_health_batch(input_data)
+    return predict_mental_health(input_data)
+
+def serve():
+    """
+    Long-lived worker mode: read one JSON request per line from stdin and
+    write one JSON response per line to stdout. The model and the drift
+    monitor stay loaded, so drift windows accumulate across requests.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            result = predict_request(json.loads(line))
+        except json.JSONDecodeError as e:
+            result = {
+                'success': False,
+                'error': f'Invalid JSON input: {str(e)}'
+            }
+        sys.stdout.write(json.dumps(result) + '\n')
+        sys.stdout.flush()
+
 if __name__ == '__main__':
     try:
         if len(sys.argv) < 2:
@@ -175,6 +270,10 @@ if __name__ == '__main__':
         
         input_arg = sys.argv[1]
         
+        if input_arg == '--serve':
+            serve()
+            sys.exit(0)
+        
         # Check if it's a file path or JSON string
         if input_arg.endswith('.json'):
             # Read from file
@@ -184,8 +283,8 @@ if __name__ == '__main__':
             # Parse as JSON string
             input_data = json.loads(input_arg)
         
-        # Make prediction
-        result = predict_mental_health(input_data)
+        # Make prediction (a JSON list is scored as a batch)
+        result = predict_request(input_data)
         
         # Output as JSON
         print(json.dumps(result))
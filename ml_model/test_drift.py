@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import LabelEncoder
+
+from drift import (DriftMonitor, build_drift_reference,
+                   population_stability_index, ks_statistic)
+
+
+def make_training_frame():
+    """Small training set: one encoded categorical column with a NaN class,
+    one wide numeric column and one small-domain numeric column"""
+    n = 1001
+    return pd.DataFrame({
+        'Substance_Use': (['Alcohol', 'Smoking', np.nan] * n)[:n],
+        'Screen_Time': (np.arange(n) // 40).astype(float),
+        'Stress_Level': [float(1 + i % 10) for i in range(n)]
+    })
+
+
+def make_reference(X):
+    encoders = {'Substance_Use': LabelEncoder().fit(X['Substance_Use'])}
+    predictions = (['Good', 'Poor'] * len(X))[:len(X)]
+    return build_drift_reference(X, predictions, encoders), encoders, predictions
+
+
+def window_counts(monitor):
+    return {name: list(counts) for name, _, _, _, counts, _ in monitor.features}
+
+
+def test_psi_and_ks_of_identical_histograms_are_zero():
+    hist = [10, 40, 30, 20, 0]
+    assert population_stability_index(hist, hist) < 1e-9
+    assert ks_statistic(hist, hist) < 1e-9
+
+
+def test_psi_and_ks_flag_shifted_histogram():
+    expected = [10, 40, 30, 20, 0]
+    shifted = [0, 10, 40, 30, 20]
+    assert population_stability_index(expected, shifted) > 0.25
+    assert ks_statistic(expected, shifted) >= 0.3
+
+
+def test_update_matches_update_batch():
+    X = make_training_frame()
+    reference, encoders, _ = make_reference(X)
+    rows = [
+        {'Substance_Use': 'Alcohol', 'Screen_Time': 12.5, 'Stress_Level': 3},
+        {'Substance_Use': 'None', 'Screen_Time': 'abc', 'Stress_Level': 11},
+        {'Substance_Use': None, 'Screen_Time': np.nan, 'Stress_Level': '7'},
+        {'Substance_Use': np.nan, 'Screen_Time': 500, 'Stress_Level': None},
+        {'Substance_Use': 'Drugs', 'Screen_Time': -1}
+    ]
+    predictions = ['Good', 'Poor', 'Unseen', 'Good', 'Poor']
+
+    single = DriftMonitor(reference, encoders, report_every=10000)
+    for row, prediction in zip(rows, predictions):
+        single.update(row, prediction)
+    batch = DriftMonitor(reference, encoders, report_every=10000)
+    batch.update_batch(pd.DataFrame(rows), predictions)
+
+    assert window_counts(single) == window_counts(batch)
+    assert single.class_counts == batch.class_counts
+
+    # 'None' and 'Drugs' are unknown to the encoder; None/NaN is its NaN class
+    substance = window_counts(single)['Substance_Use']
+    categories = reference['features']['Substance_Use']['categories']
+    assert substance[-1] == 2
+    assert substance[categories.index(None)] == 2
+    # 'abc' and NaN in a numeric column count as unseen
+    assert window_counts(single)['Screen_Time'][-1] == 2
+
+
+def test_report_fires_at_report_every_boundary():
+    X = make_training_frame()
+    reference, encoders, predictions = make_reference(X)
+    rows = X.to_dict('records')
+
+    single = DriftMonitor(reference, encoders, report_every=5)
+    for row, prediction in zip(rows[:4], predictions[:4]):
+        single.update(row, prediction)
+    assert single.last_report is None
+    single.update(rows[4], predictions[4])
+    assert single.last_report['window_records'] == 5
+    assert single.window_records == 0
+
+    batch = DriftMonitor(reference, encoders, report_every=5)
+    batch.update_batch(X.iloc[:7], predictions[:7])
+    assert batch.last_report == single.last_report
+    assert batch.window_records == 2
+    assert batch.records == 7
+
+
+def test_reference_bins_match_monitor_bins():
+    X = make_training_frame()
+    reference, encoders, predictions = make_reference(X)
+
+    # Screen_Time comes in blocks of 40 equal values, so its quantile
+    # edges fall exactly on training values
+    edges = reference['features']['Screen_Time']['edges']
+    assert set(edges) <= set(X['Screen_Time'])
+
+    monitor = DriftMonitor(reference, encoders, report_every=10000)
+    for row, prediction in zip(X.to_dict('records'), predictions):
+        monitor.update(row, prediction)
+    for name, counts in window_counts(monitor).items():
+        assert counts == reference['features'][name]['counts'], name
+
+    report = monitor.compute()
+    assert all(scores['psi'] < 1e-6 for scores in report['features'].values())
+
+
+if __name__ == '__main__':
+    print("=" * 70)
+    print("🧪 Testing Drift Monitor")
+    print("=" * 70)
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"   ✅ {name}")
+    print("=" * 70)
@@ -0,0 +1,68 @@
+import json
+import os
+import subprocess
+import sys
+
+ML_DIR = os.path.dirname(os.path.abspath(__file__))
+
+record = {
+    "Age": 20, "Gender": "Male", "Education_Level": "Graduate",
+    "Sleep_Hours": 6, "Sleep_Quality": 6, "Diet_Quality": "Average",
+    "Exercise_Freq": 5, "Stress_Level": 6, "Anxiety_Level": 7,
+    "Depression_Symptoms": 7, "Self_Esteem": 7, "Coping_Skills": 8,
+    "Life_Satisfaction": 7, "Life_Purpose": 7, "Family_Support": 7,
+    "Social_Isolation": 7, "Loneliness_Frequency": 7, "Relationship_Quality": 7,
+    "Physical_Disability": "No", "Disability_Adjustment": 10,
+    "Chronic_Illness": "No", "Work_Study_Pressure": "Medium",
+    "Weekly_Work_Study_Hours": 20, "Financial_Stress": 7,
+    "Access_Therapy": "No", "Substance_Use": "Alcohol", "Screen_Time": 7
+}
+
+
+def serve(lines, report_every):
+    """Run predict.py --serve over the given request lines"""
+    env = dict(os.environ, DRIFT_REPORT_EVERY=str(report_every))
+    result = subprocess.run(
+        [sys.executable, 'predict.py', '--serve'],
+        input=''.join(line + '\n' for line in lines),
+        capture_output=True, text=True, cwd=ML_DIR, env=env, timeout=120
+    )
+    return [json.loads(line) for line in result.stdout.splitlines()]
+
+
+def test_serve_answers_every_line_in_order():
+    other = dict(record, Screen_Time=11, Substance_Use='Smoking')
+    replies = serve([
+        json.dumps(record),
+        'not json',
+        json.dumps([record, other]),
+        json.dumps(other)
+    ], report_every=3)
+
+    assert len(replies) == 4
+
+    single, invalid, batch, last = replies
+    assert single['success'] and 'prediction' in single
+    assert single['drift'] is None
+
+    assert not invalid['success']
+    assert invalid['error'].startswith('Invalid JSON input')
+
+    # The batch brings the window to report_every records
+    assert batch['success'] and len(batch['results']) == 2
+    assert batch['drift']['window_records'] == 3
+    assert batch['drift']['total_records'] == 3
+    assert sum(batch['drift']['prediction_counts'].values()) == 3
+
+    # Later replies carry the same periodic report until the next window
+    assert last['success'] and 'prediction' in last
+    assert last['drift'] == batch['drift']
+
+
+if __name__ == '__main__':
+    print("=" * 70)
+    print("🧪 Testing predict.py --serve")
+    print("=" * 70)
+    test_serve_answers_every_line_in_order()
+    print("   ✅ test_serve_answers_every_line_in_order")
+    print("=" * 70)
@@ -6,6 +6,7 @@ from sklearn.preprocessing import LabelEncoder
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
 import joblib
 import json
+from drift import build_drift_reference, DRIFT_REFERENCE_PATH
 
 print("="*70)
 print("🏥 MindCare India - ML Model Training")
@@ -25,6 +26,9 @@ y = df_ml['Mental_Health_Status']
 print(f"\n📊 Target Distribution:")
 print(y.value_counts())
 
+# Keep raw values for the drift reference profile
+X_raw = X.copy()
+
 # Encode categorical variables
 print("\n🔧 Encoding categorical variables...")
 label_encoders = {}
@@ -130,6 +134,14 @@ with open('models/model_info.json', 'w') as f:
     json.dump(model_info, f, indent=2)
 print("   ✅ Saved: models/model_info.json")
 
+# Save drift reference profile (raw training inputs + predicted classes)
+drift_reference = build_drift_reference(
+    X_raw.loc[X_train.index], model.predict(X_train), label_encoders
+)
+with open(DRIFT_REFERENCE_PATH, 'w') as f:
+    json.dump(drift_reference, f, indent=2)
+print(f"   ✅ Saved: {DRIFT_REFERENCE_PATH}")
+
 print("\n" + "="*70)
 print("✅ MODEL TRAINING COMPLETE!")
 print("="*70)